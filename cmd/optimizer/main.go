@@ -2,7 +2,10 @@ package main
 
 import (
 	"context"
+	"crypto/sha256"
+	"encoding/hex"
 	"encoding/json"
+	"errors"
 	"flag"
 	"fmt"
 	"log"
@@ -12,6 +15,7 @@ import (
 	"os"
 	"os/signal"
 	"sort"
+	"strings"
 	"syscall"
 	"time"
 
@@ -31,6 +35,13 @@ type OptimizerService struct {
 	cancel           context.CancelFunc
 }
 
+const (
+	// maxShareBatchBytes caps the request body accepted by /share-result/batch
+	maxShareBatchBytes = 32 << 20
+	// maxShareBatchItems caps the number of results accepted in one batch
+	maxShareBatchItems = 1000
+)
+
 // Config holds the optimizer service configuration
 type Config struct {
 	Port          int                         `json:"port"`
@@ -172,6 +183,7 @@ func (s *OptimizerService) setupRoutes(mux *http.ServeMux) {
 	mux.HandleFunc("/metrics", s.metricsHandler)
 	mux.HandleFunc("/shared-results", s.sharedResultsHandler)
 	mux.HandleFunc("/share-result", s.shareResultHandler)
+	mux.HandleFunc("/share-result/batch", s.shareResultBatchHandler)
 }
 
 // setupMessageHandlers sets up message queue handlers
@@ -724,8 +736,23 @@ func (s *OptimizerService) sharedResultsHandler(w http.ResponseWriter, r *http.R
 
 	results := s.resultSharingMgr.GetAllSharedResults()
 
+	// Encode once and tag the bytes so unchanged data can be answered with 304
+	body, err := json.Marshal(results)
+	if err != nil {
+		http.Error(w, fmt.Sprintf("Failed to encode results: %v", err), http.StatusInternalServerError)
+		return
+	}
+
+	hash := sha256.Sum256(body)
+	etag := `"` + hex.EncodeToString(hash[:16]) + `"`
+	w.Header().Set("ETag", etag)
+	if etagMatches(r.Header.Get("If-None-Match"), etag) {
+		w.WriteHeader(http.StatusNotModified)
+		return
+	}
+
 	response := map[string]interface{}{
-		"results":   results,
+		"results":   json.RawMessage(body),
 		"count":     len(results),
 		"timestamp": time.Now(),
 	}
@@ -734,6 +761,20 @@ func (s *OptimizerService) sharedResultsHandler(w http.ResponseWriter, r *http.R
 	json.NewEncoder(w).Encode(response)
 }
 
+// etagMatches reports whether an If-None-Match header value matches etag
+func etagMatches(ifNoneMatch, etag string) bool {
+	if ifNoneMatch == "" {
+		return false
+	}
+	for _, candidate := range strings.Split(ifNoneMatch, ",") {
+		candidate = strings.TrimPrefix(strings.TrimSpace(candidate), "W/")
+		if candidate == "*" || candidate == etag {
+			return true
+		}
+	}
+	return false
+}
+
 // shareResultHandler handles manual result sharing requests
 func (s *OptimizerService) shareResultHandler(w http.ResponseWriter, r *http.Request) {
 	if r.Method != http.MethodPost {
@@ -752,17 +793,14 @@ func (s *OptimizerService) shareResultHandler(w http.ResponseWriter, r *http.Req
 		return
 	}
 
-	// Set missing fields
-	if sharedResult.ID == "" {
-		sharedResult.ID = fmt.Sprintf("%s_%s_%d", sharedResult.TaskID, sharedResult.StrategyName, time.Now().Unix())
-	}
-	if sharedResult.DiscoveredAt.IsZero() {
-		sharedResult.DiscoveredAt = time.Now()
-	}
-	if sharedResult.DiscoveredBy == "" {
-		sharedResult.DiscoveredBy = "manual-upload"
+	if err := validateSharedResultTaskID(sharedResult.TaskID); err != nil {
+		http.Error(w, fmt.Sprintf("Invalid request: %v", err), http.StatusBadRequest)
+		return
 	}
 
+	// Set missing fields
+	fillSharedResultDefaults(&sharedResult, "")
+
 	// Share the result
 	if err := s.resultSharingMgr.ShareResult(&sharedResult); err != nil {
 		http.Error(w, fmt.Sprintf("Failed to share result: %v", err), http.StatusInternalServerError)
@@ -780,6 +818,115 @@ func (s *OptimizerService) shareResultHandler(w http.ResponseWriter, r *http.Req
 	json.NewEncoder(w).Encode(response)
 }
 
+// shareResultBatchHandler handles sharing multiple results in a single request
+func (s *OptimizerService) shareResultBatchHandler(w http.ResponseWriter, r *http.Request) {
+	if r.Method != http.MethodPost {
+		http.Error(w, "Method not allowed", http.StatusMethodNotAllowed)
+		return
+	}
+
+	if s.resultSharingMgr == nil {
+		http.Error(w, "Result sharing not enabled", http.StatusServiceUnavailable)
+		return
+	}
+
+	r.Body = http.MaxBytesReader(w, r.Body, maxShareBatchBytes)
+
+	var req struct {
+		Items []*automl.SharedResult `json:"items"`
+	}
+	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+		var maxBytesErr *http.MaxBytesError
+		if errors.As(err, &maxBytesErr) {
+			http.Error(w, fmt.Sprintf("Request body exceeds %d bytes", maxShareBatchBytes), http.StatusRequestEntityTooLarge)
+			return
+		}
+		http.Error(w, fmt.Sprintf("Invalid request: %v", err), http.StatusBadRequest)
+		return
+	}
+	if len(req.Items) == 0 {
+		http.Error(w, "Invalid request: items must not be empty", http.StatusBadRequest)
+		return
+	}
+	if len(req.Items) > maxShareBatchItems {
+		http.Error(w, fmt.Sprintf("Invalid request: at most %d items per batch", maxShareBatchItems), http.StatusBadRequest)
+		return
+	}
+
+	ids := make([]string, 0, len(req.Items))
+	skipped := make([]int, 0)
+	failed := make(map[int]string)
+	for i, sharedResult := range req.Items {
+		if sharedResult == nil {
+			failed[i] = "empty item"
+			continue
+		}
+		if err := validateSharedResultTaskID(sharedResult.TaskID); err != nil {
+			failed[i] = err.Error()
+			continue
+		}
+		// Suffix generated IDs with the item index to keep them unique within a batch
+		fillSharedResultDefaults(sharedResult, fmt.Sprintf("_%d", i))
+
+		// ShareResult silently drops results it will not store, so report them separately
+		if !s.resultSharingMgr.AcceptsResult(sharedResult) {
+			skipped = append(skipped, i)
+			continue
+		}
+		if err := s.resultSharingMgr.ShareResult(sharedResult); err != nil {
+			failed[i] = err.Error()
+			continue
+		}
+		ids = append(ids, sharedResult.ID)
+	}
+
+	status := "success"
+	code := http.StatusOK
+	switch {
+	case len(ids) == 0:
+		status = "failed"
+		code = http.StatusUnprocessableEntity
+	case len(failed) > 0 || len(skipped) > 0:
+		status = "partial"
+	}
+
+	response := map[string]interface{}{
+		"status":    status,
+		"ids":       ids,
+		"shared":    len(ids),
+		"skipped":   skipped,
+		"failed":    failed,
+		"timestamp": time.Now(),
+	}
+
+	w.Header().Set("Content-Type", "application/json")
+	w.WriteHeader(code)
+	json.NewEncoder(w).Encode(response)
+}
+
+// validateSharedResultTaskID rejects task IDs that could escape the sharing directory,
+// since file-mode sharing uses the task ID in the result file name
+func validateSharedResultTaskID(taskID string) error {
+	if strings.ContainsAny(taskID, `/\`) || strings.Contains(taskID, "..") {
+		return fmt.Errorf("invalid task_id %q: must not contain path separators or '..'", taskID)
+	}
+	return nil
+}
+
+// fillSharedResultDefaults sets fields a manually uploaded result may omit.
+// idSuffix is appended to a generated ID, e.g. to keep IDs unique within a batch.
+func fillSharedResultDefaults(sharedResult *automl.SharedResult, idSuffix string) {
+	if sharedResult.ID == "" {
+		sharedResult.ID = fmt.Sprintf("%s_%s_%d%s", sharedResult.TaskID, sharedResult.StrategyName, time.Now().Unix(), idSuffix)
+	}
+	if sharedResult.DiscoveredAt.IsZero() {
+		sharedResult.DiscoveredAt = time.Now()
+	}
+	if sharedResult.DiscoveredBy == "" {
+		sharedResult.DiscoveredBy = "manual-upload"
+	}
+}
+
 // loadConfig loads configuration from file or uses defaults
 func loadConfig(configFile string, port int, logLevel string) (*Config, error) {
 	cfg := &Config{
@@ -0,0 +1,363 @@
+package main
+
+import (
+	"bytes"
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+	"time"
+
+	"qcat/internal/learning/automl"
+)
+
+// newTestService creates an optimizer service backed by file-mode result sharing in a temp dir
+func newTestService(t *testing.T) *OptimizerService {
+	t.Helper()
+
+	// NewResultSharingManager creates ./data/shared_results relative to the working directory
+	dir := t.TempDir()
+	wd, err := os.Getwd()
+	if err != nil {
+		t.Fatalf("Failed to get working directory: %v", err)
+	}
+	if err := os.Chdir(dir); err != nil {
+		t.Fatalf("Failed to change directory: %v", err)
+	}
+	t.Cleanup(func() { os.Chdir(wd) })
+
+	cfg := &automl.ResultSharingConfig{Enabled: true, Mode: "file"}
+	cfg.FileSharing.Directory = dir
+	cfg.PerformanceThreshold.MinProfitRate = 0.05
+	cfg.PerformanceThreshold.MinSharpeRatio = 0.5
+	cfg.PerformanceThreshold.MaxDrawdown = 0.2
+
+	mgr, err := automl.NewResultSharingManager(cfg)
+	if err != nil {
+		t.Fatalf("Failed to create result sharing manager: %v", err)
+	}
+
+	return &OptimizerService{resultSharingMgr: mgr}
+}
+
+func goodResult(taskID string, seed int64) map[string]interface{} {
+	return map[string]interface{}{
+		"task_id":       taskID,
+		"strategy_name": "ma_cross",
+		"random_seed":   seed,
+		"performance": map[string]interface{}{
+			"profit_rate":  0.12,
+			"sharpe_ratio": 1.5,
+			"max_drawdown": 0.08,
+		},
+	}
+}
+
+func postBatch(t *testing.T, s *OptimizerService, items interface{}) (*httptest.ResponseRecorder, map[string]interface{}) {
+	t.Helper()
+
+	body, err := json.Marshal(map[string]interface{}{"items": items})
+	if err != nil {
+		t.Fatalf("Failed to marshal request: %v", err)
+	}
+
+	req := httptest.NewRequest(http.MethodPost, "/share-result/batch", bytes.NewReader(body))
+	rec := httptest.NewRecorder()
+	s.shareResultBatchHandler(rec, req)
+
+	// http.Error responses are plain text; only JSON bodies are parsed
+	var resp map[string]interface{}
+	if strings.HasPrefix(rec.Header().Get("Content-Type"), "application/json") {
+		if err := json.Unmarshal(rec.Body.Bytes(), &resp); err != nil {
+			t.Fatalf("Failed to parse response: %v", err)
+		}
+	}
+	return rec, resp
+}
+
+func TestShareResultBatchHandler(t *testing.T) {
+	t.Run("empty items", func(t *testing.T) {
+		s := newTestService(t)
+		rec, _ := postBatch(t, s, []interface{}{})
+		if rec.Code != http.StatusBadRequest {
+			t.Errorf("Expected status 400, got %d", rec.Code)
+		}
+	})
+
+	t.Run("nil item only", func(t *testing.T) {
+		s := newTestService(t)
+		rec, resp := postBatch(t, s, []interface{}{nil})
+		if rec.Code != http.StatusUnprocessableEntity {
+			t.Errorf("Expected status 422, got %d", rec.Code)
+		}
+		if resp["status"] != "failed" {
+			t.Errorf("Expected status 'failed', got '%v'", resp["status"])
+		}
+		failed, _ := resp["failed"].(map[string]interface{})
+		if _, ok := failed["0"]; !ok {
+			t.Errorf("Expected item 0 to be reported as failed, got %v", resp["failed"])
+		}
+	})
+
+	t.Run("mixed batch", func(t *testing.T) {
+		s := newTestService(t)
+		belowThreshold := goodResult("task_low", 3)
+		belowThreshold["performance"] = map[string]interface{}{
+			"profit_rate":  0.01,
+			"sharpe_ratio": 0.1,
+			"max_drawdown": 0.5,
+		}
+		// A file name longer than the filesystem limit makes the write fail, even as root
+		unwritable := goodResult(strings.Repeat("t", 300), 4)
+
+		rec, resp := postBatch(t, s, []interface{}{
+			goodResult("task_001", 1),
+			nil,
+			belowThreshold,
+			unwritable,
+		})
+		if rec.Code != http.StatusOK {
+			t.Fatalf("Expected status 200, got %d", rec.Code)
+		}
+		if resp["status"] != "partial" {
+			t.Errorf("Expected status 'partial', got '%v'", resp["status"])
+		}
+		if resp["shared"] != float64(1) {
+			t.Errorf("Expected 1 shared result, got %v", resp["shared"])
+		}
+
+		skipped, _ := resp["skipped"].([]interface{})
+		if len(skipped) != 1 || skipped[0] != float64(2) {
+			t.Errorf("Expected item 2 to be skipped, got %v", resp["skipped"])
+		}
+
+		failed, _ := resp["failed"].(map[string]interface{})
+		for _, idx := range []string{"1", "3"} {
+			if _, ok := failed[idx]; !ok {
+				t.Errorf("Expected item %s to be reported as failed, got %v", idx, resp["failed"])
+			}
+		}
+	})
+
+	t.Run("too many items", func(t *testing.T) {
+		s := newTestService(t)
+		items := make([]interface{}, maxShareBatchItems+1)
+		rec, _ := postBatch(t, s, items)
+		if rec.Code != http.StatusBadRequest {
+			t.Errorf("Expected status 400, got %d", rec.Code)
+		}
+	})
+
+	t.Run("path traversal in task_id", func(t *testing.T) {
+		s := newTestService(t)
+		rec, resp := postBatch(t, s, []interface{}{
+			goodResult("../../escaped", 1),
+			goodResult(`nested\task`, 2),
+			goodResult("task_001", 3),
+		})
+		if rec.Code != http.StatusOK {
+			t.Fatalf("Expected status 200, got %d", rec.Code)
+		}
+		if resp["shared"] != float64(1) {
+			t.Errorf("Expected 1 shared result, got %v", resp["shared"])
+		}
+
+		failed, _ := resp["failed"].(map[string]interface{})
+		for _, idx := range []string{"0", "1"} {
+			msg, _ := failed[idx].(string)
+			if !strings.Contains(msg, "invalid task_id") {
+				t.Errorf("Expected item %s to fail validation, got %v", idx, failed[idx])
+			}
+		}
+
+		escaped, _ := filepath.Glob(filepath.Join("..", "..", "escaped*"))
+		if len(escaped) != 0 {
+			t.Errorf("Expected no files outside the sharing directory, got %v", escaped)
+		}
+	})
+
+	t.Run("identical items are stored separately", func(t *testing.T) {
+		s := newTestService(t)
+		items := []interface{}{
+			goodResult("task_001", 1),
+			goodResult("task_001", 1),
+			goodResult("task_001", 1),
+		}
+		rec, resp := postBatch(t, s, items)
+		if rec.Code != http.StatusOK {
+			t.Fatalf("Expected status 200, got %d", rec.Code)
+		}
+		if resp["shared"] != float64(len(items)) {
+			t.Errorf("Expected %d shared results, got %v", len(items), resp["shared"])
+		}
+
+		// The sharing directory is the working directory set up by newTestService
+		files, err := filepath.Glob("*.json")
+		if err != nil {
+			t.Fatalf("Failed to list result files: %v", err)
+		}
+		if len(files) != len(items) {
+			t.Errorf("Expected %d result files, got %d: %v", len(items), len(files), files)
+		}
+
+		if err := s.resultSharingMgr.LoadSharedResults(); err != nil {
+			t.Fatalf("Failed to load shared results: %v", err)
+		}
+		if got := len(s.resultSharingMgr.GetAllSharedResults()); got != len(items) {
+			t.Errorf("Expected %d stored results, got %d", len(items), got)
+		}
+	})
+
+	t.Run("unique generated ids", func(t *testing.T) {
+		s := newTestService(t)
+		rec, resp := postBatch(t, s, []interface{}{
+			goodResult("task_001", 1),
+			goodResult("task_001", 2),
+			goodResult("task_001", 3),
+		})
+		if rec.Code != http.StatusOK {
+			t.Fatalf("Expected status 200, got %d", rec.Code)
+		}
+		if resp["status"] != "success" {
+			t.Errorf("Expected status 'success', got '%v'", resp["status"])
+		}
+
+		ids, _ := resp["ids"].([]interface{})
+		if len(ids) != 3 {
+			t.Fatalf("Expected 3 ids, got %v", resp["ids"])
+		}
+		seen := make(map[interface{}]bool)
+		for _, id := range ids {
+			if seen[id] {
+				t.Errorf("Duplicate generated id: %v", id)
+			}
+			seen[id] = true
+		}
+	})
+}
+
+func TestEtagMatches(t *testing.T) {
+	etag := `"abc123"`
+	tests := []struct {
+		name        string
+		ifNoneMatch string
+		want        bool
+	}{
+		{"empty header", "", false},
+		{"exact match", `"abc123"`, true},
+		{"weak match", `W/"abc123"`, true},
+		{"wildcard", "*", true},
+		{"list containing match", `"other", "abc123"`, true},
+		{"list without match", `"other", W/"another"`, false},
+		{"different tag", `"abc124"`, false},
+		{"unquoted tag", "abc123", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := etagMatches(tt.ifNoneMatch, etag); got != tt.want {
+				t.Errorf("etagMatches(%q) = %v, want %v", tt.ifNoneMatch, got, tt.want)
+			}
+		})
+	}
+}
+
+func getSharedResults(s *OptimizerService, ifNoneMatch string) *httptest.ResponseRecorder {
+	req := httptest.NewRequest(http.MethodGet, "/shared-results", nil)
+	if ifNoneMatch != "" {
+		req.Header.Set("If-None-Match", ifNoneMatch)
+	}
+	rec := httptest.NewRecorder()
+	s.sharedResultsHandler(rec, req)
+	return rec
+}
+
+func TestSharedResultsHandlerETag(t *testing.T) {
+	s := newTestService(t)
+
+	// Records with identical (zero) discovery times must still produce a stable tag
+	for _, id := range []string{"r1", "r2", "r3", "r4", "r5"} {
+		data, err := json.Marshal(&automl.SharedResult{ID: id, TaskID: "task_001", StrategyName: "ma_cross"})
+		if err != nil {
+			t.Fatalf("Failed to marshal result: %v", err)
+		}
+		if err := os.WriteFile(id+".json", data, 0644); err != nil {
+			t.Fatalf("Failed to write result file: %v", err)
+		}
+	}
+	if err := s.resultSharingMgr.LoadSharedResults(); err != nil {
+		t.Fatalf("Failed to load shared results: %v", err)
+	}
+
+	first := getSharedResults(s, "")
+	if first.Code != http.StatusOK {
+		t.Fatalf("Expected status 200, got %d", first.Code)
+	}
+	etag := first.Header().Get("ETag")
+	if etag == "" {
+		t.Fatal("Expected ETag header")
+	}
+
+	var resp struct {
+		Results []automl.SharedResult `json:"results"`
+		Count   int                   `json:"count"`
+	}
+	if err := json.Unmarshal(first.Body.Bytes(), &resp); err != nil {
+		t.Fatalf("Failed to parse response: %v", err)
+	}
+	if resp.Count != 5 || len(resp.Results) != 5 {
+		t.Errorf("Expected 5 results, got count=%d len=%d", resp.Count, len(resp.Results))
+	}
+
+	t.Run("stable tag", func(t *testing.T) {
+		for i := 0; i < 20; i++ {
+			if got := getSharedResults(s, "").Header().Get("ETag"); got != etag {
+				t.Fatalf("ETag changed between requests: %s != %s", got, etag)
+			}
+		}
+	})
+
+	t.Run("matching If-None-Match", func(t *testing.T) {
+		rec := getSharedResults(s, etag)
+		if rec.Code != http.StatusNotModified {
+			t.Errorf("Expected status 304, got %d", rec.Code)
+		}
+		if rec.Body.Len() != 0 {
+			t.Errorf("Expected empty body, got %q", rec.Body.String())
+		}
+	})
+
+	t.Run("non-matching If-None-Match", func(t *testing.T) {
+		rec := getSharedResults(s, `"stale"`)
+		if rec.Code != http.StatusOK {
+			t.Errorf("Expected status 200, got %d", rec.Code)
+		}
+		if rec.Body.Len() == 0 {
+			t.Error("Expected non-empty body")
+		}
+	})
+
+	t.Run("tag changes with data", func(t *testing.T) {
+		data, err := json.Marshal(&automl.SharedResult{ID: "r6", TaskID: "task_002", StrategyName: "rsi", DiscoveredAt: time.Now()})
+		if err != nil {
+			t.Fatalf("Failed to marshal result: %v", err)
+		}
+		if err := os.WriteFile("r6.json", data, 0644); err != nil {
+			t.Fatalf("Failed to write result file: %v", err)
+		}
+		if err := s.resultSharingMgr.LoadSharedResults(); err != nil {
+			t.Fatalf("Failed to load shared results: %v", err)
+		}
+
+		rec := getSharedResults(s, etag)
+		if rec.Code != http.StatusOK {
+			t.Errorf("Expected status 200 after data change, got %d", rec.Code)
+		}
+		if rec.Header().Get("ETag") == etag {
+			t.Error("Expected ETag to change after data change")
+		}
+	})
+}
@@ -236,6 +236,11 @@ func (rsm *ResultSharingManager) ShareResult(result *SharedResult) error {
 	}
 }
 
+// AcceptsResult 检查结果是否会被共享（已启用且满足性能阈值）
+func (rsm *ResultSharingManager) AcceptsResult(result *SharedResult) bool {
+	return rsm.config.Enabled && rsm.meetsPerformanceThreshold(result)
+}
+
 // meetsPerformanceThreshold 检查是否满足性能阈值
 func (rsm *ResultSharingManager) meetsPerformanceThreshold(result *SharedResult) bool {
 	if result.Performance == nil {
@@ -260,8 +265,10 @@ func (rsm *ResultSharingManager) meetsPerformanceThreshold(result *SharedResult)
 }
 
 // generateShareSignature 生成共享签名
+// 签名包含结果ID，使同一任务、同一秒内的不同结果写入不同的共享文件
 func (rsm *ResultSharingManager) generateShareSignature(result *SharedResult) string {
-	data := fmt.Sprintf("%s:%s:%s:%d:%s",
+	data := fmt.Sprintf("%s:%s:%s:%s:%d:%s",
+		result.ID,
 		result.TaskID,
 		result.StrategyName,
 		result.DataHash,
@@ -789,9 +796,12 @@ func (rsm *ResultSharingManager) GetAllSharedResults() []*SharedResult {
 		results = append(results, result)
 	}
 
-	// 按发现时间排序
-	sort.Slice(results, func(i, j int) bool {
-		return results[i].DiscoveredAt.After(results[j].DiscoveredAt)
+	// 按发现时间排序，时间相同时按ID排序以保证顺序稳定
+	sort.SliceStable(results, func(i, j int) bool {
+		if !results[i].DiscoveredAt.Equal(results[j].DiscoveredAt) {
+			return results[i].DiscoveredAt.After(results[j].DiscoveredAt)
+		}
+		return results[i].ID < results[j].ID
 	})
 
 	return results